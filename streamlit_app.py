@@ -1,38 +1,175 @@
+from datetime import date, timedelta
+
 import streamlit as st
+from snowflake.snowpark import Session
 from snowflake.snowpark.context import get_active_session
+from snowflake.snowpark.exceptions import SnowparkSessionException
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import plotly.express as px
+
+@st.cache_resource
+def get_session() -> Session:
+    try:
+        return get_active_session()
+    except SnowparkSessionException:
+        # Running outside Snowflake (e.g. the devcontainer): connect once with .streamlit/secrets.toml
+        return Session.builder.configs(dict(st.secrets["snowflake"])).create()
 
-session = get_active_session()
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_query(sql: str, params: tuple | None = None) -> pd.DataFrame:
+    return get_session().sql(sql, params=list(params) if params else None).to_pandas()
 
-def run_query(sql: str) -> pd.DataFrame:
+def run_query(sql: str, params: list | None = None) -> pd.DataFrame:
     try:
-        return session.sql(sql).to_pandas()
+        return fetch_query(sql, tuple(params) if params else None)
     except Exception as e:
         st.error(f"Query error: {e}")
         return pd.DataFrame()
 
-st.title("Keells Supermarket - Interactive Enterprise Dashboard")
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_arrow(sql: str, params: tuple | None = None) -> pa.Table:
+    return get_session().sql(sql, params=list(params) if params else None).to_arrow()
 
-tabs = st.tabs([
-    "Overview",
-    "Store Performance",
-    "Product Sales",
-    "Customer Insights",
-    "Inventory",
-    "Promotions",
-    "Search"
-])
+def run_query_arrow(sql: str, params: list | None = None) -> pa.Table:
+    """Like run_query, but skips Snowpark's pandas conversion for results only handed to Streamlit."""
+    try:
+        return fetch_arrow(sql, tuple(params) if params else None)
+    except Exception as e:
+        st.error(f"Query error: {e}")
+        return pa.table({})
+
+# Small, slowly-changing lookups mirrored from Snowflake into an in-process DuckDB
+DIMENSION_MIRROR = {
+    "dim_store": "SELECT store_name FROM DIM_STORE",
+    "dim_category": "SELECT DISTINCT category FROM DIM_PRODUCT",
+    "dim_loyalty_tier": "SELECT DISTINCT loyalty_tier FROM FACT_ORDERS WHERE loyalty_tier IS NOT NULL",
+}
+
+@st.cache_resource(show_spinner=False)
+def get_dimension_db() -> duckdb.DuckDBPyConnection:
+    return duckdb.connect()
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def load_dimension(table: str) -> None:
+    # Each table is mirrored on first use and refreshed on its own, so one failing
+    # Snowflake query only breaks the picker that reads from it
+    snapshot = fetch_query(DIMENSION_MIRROR[table])
+    con = get_dimension_db().cursor()
+    con.register("snapshot", snapshot)
+    con.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM snapshot")
+    con.unregister("snapshot")
+
+def fetch_dimension(table: str, sql: str) -> list:
+    load_dimension(table)
+    # cursor() gives each script thread its own handle on the shared database
+    return get_dimension_db().cursor().execute(sql).df().iloc[:, 0].dropna().tolist()
+
+def dimension_values(table: str, sql: str) -> list:
+    try:
+        return fetch_dimension(table, sql)
+    except Exception as e:
+        st.error(f"Query error: {e}")
+        return []
+
+def get_stores() -> list:
+    return dimension_values("dim_store", "SELECT store_name FROM dim_store ORDER BY 1")
+
+def get_categories() -> list:
+    return dimension_values("dim_category", "SELECT category FROM dim_category ORDER BY 1")
+
+def get_loyalty_tiers() -> list:
+    return dimension_values("dim_loyalty_tier", "SELECT loyalty_tier FROM dim_loyalty_tier ORDER BY 1")
+
+def allowed_only(selected: list, options: list) -> list:
+    """Drop any selected value that is not in the dimension's option list."""
+    allowed = frozenset(options)
+    return [v for v in selected if v in allowed]
+
+def remember(key: str) -> None:
+    """on_change callback: copy a widget's value to a key Streamlit keeps while its section is hidden."""
+    st.session_state[f"saved_{key}"] = st.session_state[key]
+
+def recall(key: str, default):
+    return st.session_state.get(f"saved_{key}", default)
+
+def placeholders(values: list) -> str:
+    """Comma-separated '?' bind markers, one per value."""
+    return ", ".join(["?"] * len(values))
+
+# Above this many selected stores, pivot in pandas instead of emitting one SQL column per store
+MAX_SQL_PIVOT_COLUMNS = 10
+
+# Default look-back for the Store Performance date range, and a safety cap on its (date, store) rows
+DEFAULT_DATE_WINDOW_DAYS = 90
+MAX_ROWS = 10000
+
+# Products listed per category in Product Sales
+TOP_PRODUCTS_PER_CATEGORY = 10
+
+def store_sales(stores: list, start_date: date, end_date: date) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Daily sales by store (wide, one column per store) and total sales per store."""
+    store_list_sql = placeholders(stores)
+    date_params = [start_date, end_date]
+    if len(stores) <= MAX_SQL_PIVOT_COLUMNS:
+        # Pivot server-side with one conditional SUM per store column; names stay bound
+        # and the positional aliases are renamed below
+        store_cols_sql = ",\n".join(
+            f"SUM(CASE WHEN ds.store_name = ? THEN fol.quantity * fol.unit_price ELSE 0 END) AS store_{i}"
+            for i in range(len(stores))
+        )
+        daily = run_query(f"""
+            SELECT CAST(dd.full_date AS TIMESTAMP_NTZ) AS full_date, {store_cols_sql}
+            FROM FACT_ORDER_LINES fol
+            JOIN FACT_ORDERS fo ON fol.order_id = fo.order_id
+            JOIN DIM_DATE dd ON fo.order_date_id = dd.date_id
+            JOIN DIM_STORE ds ON fo.store_id = ds.store_id
+            WHERE ds.store_name IN ({store_list_sql})
+              AND dd.full_date BETWEEN ? AND ?
+            GROUP BY dd.full_date
+            ORDER BY dd.full_date
+        """, params=[*stores, *stores, *date_params])
+        if daily.empty:
+            return daily, daily
+        daily = daily.set_index("FULL_DATE")
+        daily.columns = pd.Index(stores, name="STORE_NAME")
+    else:
+        sales_data = run_query(f"""
+            SELECT CAST(dd.full_date AS TIMESTAMP_NTZ) AS full_date, ds.store_name, SUM(fol.quantity * fol.unit_price) AS sales
+            FROM FACT_ORDER_LINES fol
+            JOIN FACT_ORDERS fo ON fol.order_id = fo.order_id
+            JOIN DIM_DATE dd ON fo.order_date_id = dd.date_id
+            JOIN DIM_STORE ds ON fo.store_id = ds.store_id
+            WHERE ds.store_name IN ({store_list_sql})
+              AND dd.full_date BETWEEN ? AND ?
+            GROUP BY dd.full_date, ds.store_name
+        """, params=[*stores, *date_params])
+        if sales_data.empty:
+            return sales_data, sales_data
+        sales_data["STORE_NAME"] = sales_data["STORE_NAME"].astype("category")
+        daily = sales_data.set_index(["FULL_DATE", "STORE_NAME"])["SALES"].unstack(fill_value=0)
+
+    # The pie totals are already in the daily frame; no second round-trip needed
+    totals = daily.sum().reset_index(name="SALES")
+    return daily, totals
+
+st.title("Keells Supermarket - Interactive Enterprise Dashboard")
 
 # --- Overview ---
-with tabs[0]:
+@st.fragment
+def overview_tab():
     st.header("Overview Metrics")
-    total_sales = run_query("SELECT COALESCE(SUM(total_value),0) AS total_sales FROM FACT_ORDERS")
-    total_orders = run_query("SELECT COUNT(order_id) AS total_orders FROM FACT_ORDERS")
-    active_customers = run_query("SELECT COUNT(DISTINCT customer_id) AS active_customers FROM FACT_ORDERS")
+    kpis = run_query("""
+        SELECT COALESCE(SUM(total_value),0) AS total_sales,
+               COUNT(order_id) AS total_orders,
+               COUNT(DISTINCT customer_id) AS active_customers
+        FROM FACT_ORDERS
+    """)
 
-    ts = total_sales.at[0, "TOTAL_SALES"] if not total_sales.empty else 0
-    to = total_orders.at[0, "TOTAL_ORDERS"] if not total_orders.empty else 0
-    ac = active_customers.at[0, "ACTIVE_CUSTOMERS"] if not active_customers.empty else 0
+    ts = kpis.at[0, "TOTAL_SALES"] if not kpis.empty else 0
+    to = kpis.at[0, "TOTAL_ORDERS"] if not kpis.empty else 0
+    ac = kpis.at[0, "ACTIVE_CUSTOMERS"] if not kpis.empty else 0
 
     c1, c2, c3 = st.columns(3)
     c1.metric("Total Sales (LKR)", f"{ts:,.2f}")
@@ -40,8 +177,8 @@ with tabs[0]:
     c3.metric("Active Customers", f"{ac}")
 
     st.markdown("### Sales Over Time")
-    sales_over_time = run_query("""
-        SELECT dd.full_date, SUM(fol.quantity * fol.unit_price) AS sales
+    sales_over_time = run_query_arrow("""
+        SELECT CAST(dd.full_date AS TIMESTAMP_NTZ) AS full_date, SUM(fol.quantity * fol.unit_price) AS sales
         FROM FACT_ORDER_LINES fol
         JOIN FACT_ORDERS fo ON fol.order_id = fo.order_id
         JOIN DIM_DATE dd ON fo.order_date_id = dd.date_id
@@ -49,101 +186,132 @@ with tabs[0]:
         ORDER BY dd.full_date
         LIMIT 100
     """)
-    if not sales_over_time.empty:
-        sales_over_time['FULL_DATE'] = pd.to_datetime(sales_over_time['FULL_DATE'])
-        sales_over_time = sales_over_time.set_index('FULL_DATE')
-        st.line_chart(sales_over_time['SALES'])
+    if sales_over_time.num_rows:
+        st.line_chart(sales_over_time, x='FULL_DATE', y='SALES')
     else:
         st.info("No sales data available.")
 
 # --- Store Performance ---
-with tabs[1]:
+@st.fragment
+def store_performance_tab():
     st.header("Store Sales Performance")
 
-    stores_df = run_query("SELECT store_name FROM DIM_STORE ORDER BY store_name")
-    stores = stores_df["STORE_NAME"].tolist()
-    selected_stores = st.multiselect("Select Stores", options=stores, default=stores)
-
-    if selected_stores:
-        store_list_sql = ", ".join([f"'{s}'" for s in selected_stores])
-        sales_data = run_query(f"""
-            SELECT ds.store_name, dd.full_date, SUM(fol.quantity * fol.unit_price) AS sales
-            FROM FACT_ORDER_LINES fol
-            JOIN FACT_ORDERS fo ON fol.order_id = fo.order_id
-            JOIN DIM_DATE dd ON fo.order_date_id = dd.date_id
-            JOIN DIM_STORE ds ON fo.store_id = ds.store_id
-            WHERE ds.store_name IN ({store_list_sql})
-            GROUP BY ds.store_name, dd.full_date
-            ORDER BY dd.full_date
-        """)
-        if not sales_data.empty:
-            pivot_df = sales_data.pivot(index='FULL_DATE', columns='STORE_NAME', values='SALES').fillna(0)
-            pivot_df.index = pd.to_datetime(pivot_df.index)
+    stores = get_stores()
+    selected_stores = allowed_only(
+        st.multiselect(
+            "Select Stores", options=stores, default=allowed_only(recall("stores", stores), stores),
+            key="stores", on_change=remember, args=("stores",),
+        ),
+        stores,
+    )
+    date_range = st.date_input(
+        "Date Range",
+        value=recall("date_range", (date.today() - timedelta(days=DEFAULT_DATE_WINDOW_DAYS), date.today())),
+        key="date_range", on_change=remember, args=("date_range",),
+    )
+
+    if selected_stores and len(date_range) == 2:
+        start_date, end_date = date_range
+        # At most one row per (date, store), so clamping the range bounds the rows fetched
+        max_days = max(1, MAX_ROWS // len(selected_stores))
+        if (end_date - start_date).days + 1 > max_days:
+            start_date = end_date - timedelta(days=max_days - 1)
+            st.warning(f"Showing only the most recent {max_days} days; narrow the date range or store selection to see earlier sales.")
+        pivot_df, total_sales_store = store_sales(selected_stores, start_date, end_date)
+        if not pivot_df.empty:
             st.line_chart(pivot_df)
-            
+
             # Pie chart of total sales per store
-            total_sales_store = sales_data.groupby("STORE_NAME")["SALES"].sum().reset_index()
             st.markdown("#### Total Sales Distribution by Store")
-            st.pyplot(total_sales_store.plot.pie(y='SALES', labels=total_sales_store['STORE_NAME'], autopct='%1.1f%%', legend=False).get_figure())
+            st.plotly_chart(px.pie(total_sales_store, names='STORE_NAME', values='SALES'))
         else:
             st.info("No sales data found for selected stores.")
-    else:
+    elif not selected_stores:
         st.info("Please select at least one store.")
+    else:
+        st.info("Please select a start and end date.")
 
 # --- Product Sales ---
-with tabs[2]:
+@st.fragment
+def product_sales_tab():
     st.header("Product Sales Analysis")
 
-    categories_df = run_query("SELECT DISTINCT category FROM DIM_PRODUCT ORDER BY category")
-    categories = categories_df["CATEGORY"].dropna().tolist()
-    selected_categories = st.multiselect("Select Categories", options=categories, default=categories)
+    categories = get_categories()
+    selected_categories = allowed_only(
+        st.multiselect(
+            "Select Categories", options=categories, default=allowed_only(recall("categories", categories), categories),
+            key="categories", on_change=remember, args=("categories",),
+        ),
+        categories,
+    )
 
     if selected_categories:
-        categories_sql = ", ".join([f"'{c}'" for c in selected_categories])
-        prod_sales = run_query(f"""
+        categories_sql = placeholders(selected_categories)
+        prod_sales = run_query_arrow(f"""
             SELECT dp.product_name, dp.category, SUM(fol.quantity) AS quantity_sold, SUM(fol.quantity * fol.unit_price) AS revenue
             FROM FACT_ORDER_LINES fol
             JOIN DIM_PRODUCT dp ON fol.product_id = dp.product_id
             WHERE dp.category IN ({categories_sql})
             GROUP BY dp.product_name, dp.category
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY dp.category ORDER BY revenue DESC) <= {TOP_PRODUCTS_PER_CATEGORY}
             ORDER BY revenue DESC
-            LIMIT 50
-        """)
-        if not prod_sales.empty:
+        """, params=selected_categories)
+        if prod_sales.num_rows:
             st.dataframe(prod_sales)
 
             # Bar chart revenue by product
-            st.markdown("### Top Products by Revenue")
-            st.bar_chart(prod_sales.set_index("PRODUCT_NAME")["REVENUE"])
-
-            # Pie chart of revenue by category
-            category_rev = prod_sales.groupby("CATEGORY")["REVENUE"].sum().reset_index()
-            st.markdown("### Revenue Distribution by Category")
-            st.pyplot(category_rev.plot.pie(y='REVENUE', labels=category_rev['CATEGORY'], autopct='%1.1f%%', legend=False).get_figure())
+            st.markdown(f"### Top {TOP_PRODUCTS_PER_CATEGORY} Products per Category by Revenue")
+            st.bar_chart(prod_sales, x="PRODUCT_NAME", y="REVENUE")
+
+            # Pie chart of revenue by category, over all products rather than just the top ones
+            category_rev = run_query(f"""
+                SELECT dp.category, SUM(fol.quantity * fol.unit_price) AS revenue
+                FROM FACT_ORDER_LINES fol
+                JOIN DIM_PRODUCT dp ON fol.product_id = dp.product_id
+                WHERE dp.category IN ({categories_sql})
+                GROUP BY dp.category
+            """, params=selected_categories)
+            if not category_rev.empty:
+                st.markdown("### Revenue Distribution by Category")
+                st.plotly_chart(px.pie(category_rev, names='CATEGORY', values='REVENUE'))
         else:
             st.info("No sales data for selected categories.")
     else:
         st.info("Please select at least one category.")
 
 # --- Customer Insights ---
-with tabs[3]:
+@st.fragment
+def customer_insights_tab():
     st.header("Customer Insights")
 
-    tiers_df = run_query("SELECT DISTINCT loyalty_tier FROM FACT_ORDERS WHERE loyalty_tier IS NOT NULL ORDER BY loyalty_tier")
-    tiers = tiers_df["LOYALTY_TIER"].tolist()
-    selected_tiers = st.multiselect("Select Loyalty Tiers", options=tiers, default=tiers)
+    tiers = get_loyalty_tiers()
+    selected_tiers = allowed_only(
+        st.multiselect(
+            "Select Loyalty Tiers", options=tiers, default=allowed_only(recall("tiers", tiers), tiers),
+            key="tiers", on_change=remember, args=("tiers",),
+        ),
+        tiers,
+    )
 
     if selected_tiers:
-        tiers_sql = ", ".join([f"'{t}'" for t in selected_tiers])
-        cust_data = run_query(f"""
-            SELECT fc.region, COUNT(DISTINCT fc.customer_id) AS customer_count, AVG(fo.total_value) AS avg_spent
+        tiers_sql = placeholders(selected_tiers)
+        # One scan yields both the per-region and the per-tier cut
+        cust_cuts = run_query(f"""
+            SELECT GROUPING(fc.region) AS by_tier, fc.region, fo.loyalty_tier,
+                   COUNT(DISTINCT fc.customer_id) AS customer_count, AVG(fo.total_value) AS avg_spent
             FROM DIM_CUSTOMER fc
             JOIN FACT_ORDERS fo ON fc.customer_id = fo.customer_id
             WHERE fo.loyalty_tier IN ({tiers_sql})
-            GROUP BY fc.region
-            ORDER BY customer_count DESC
-        """)
-        if not cust_data.empty:
+            GROUP BY GROUPING SETS ((fc.region), (fo.loyalty_tier))
+        """, params=selected_tiers)
+        if not cust_cuts.empty:
+            cust_data = (
+                cust_cuts[cust_cuts["BY_TIER"] == 0][["REGION", "CUSTOMER_COUNT", "AVG_SPENT"]]
+                .sort_values("CUSTOMER_COUNT", ascending=False)
+                .reset_index(drop=True)
+            )
+            loyalty_dist = cust_cuts[cust_cuts["BY_TIER"] == 1][["LOYALTY_TIER", "CUSTOMER_COUNT"]].reset_index(drop=True)
+
             st.dataframe(cust_data)
 
             # Bar chart customer count by region
@@ -151,39 +319,37 @@ with tabs[3]:
             st.bar_chart(cust_data.set_index("REGION")["CUSTOMER_COUNT"])
 
             # Pie chart loyalty tier distribution
-            loyalty_dist = run_query(f"""
-                SELECT loyalty_tier, COUNT(DISTINCT customer_id) AS customer_count
-                FROM FACT_ORDERS
-                WHERE loyalty_tier IN ({tiers_sql})
-                GROUP BY loyalty_tier
-            """)
             if not loyalty_dist.empty:
                 st.markdown("### Loyalty Tier Distribution")
-                st.pyplot(loyalty_dist.plot.pie(y='CUSTOMER_COUNT', labels=loyalty_dist['LOYALTY_TIER'], autopct='%1.1f%%', legend=False).get_figure())
+                st.plotly_chart(px.pie(loyalty_dist, names='LOYALTY_TIER', values='CUSTOMER_COUNT'))
         else:
             st.info("No customer data found.")
     else:
         st.info("Please select at least one loyalty tier.")
 
 # --- Inventory ---
-with tabs[4]:
+@st.fragment
+def inventory_tab():
     st.header("Inventory Status")
 
-    stores_df = run_query("SELECT store_name FROM DIM_STORE ORDER BY store_name")
-    stores = stores_df["STORE_NAME"].tolist()
-    selected_store = st.selectbox("Select Store", options=stores)
+    stores = get_stores()
+    saved_store = recall("inventory_store", None)
+    selected_store = st.selectbox(
+        "Select Store", options=stores, index=stores.index(saved_store) if saved_store in stores else 0,
+        key="inventory_store", on_change=remember, args=("inventory_store",),
+    )
 
     if selected_store:
-        inv_data = run_query(f"""
+        inv_data = run_query("""
             SELECT dp.product_name, fi.stock_level, fi.on_order_qty, fi.safety_stock
             FROM FACT_INVENTORY fi
             JOIN DIM_SKU sku ON fi.sku_id = sku.sku_id
             JOIN DIM_PRODUCT dp ON sku.product_id = dp.product_id
             JOIN DIM_STORE ds ON fi.store_id = ds.store_id
-            WHERE ds.store_name = '{selected_store}'
+            WHERE ds.store_name = ?
             ORDER BY fi.stock_level ASC
             LIMIT 100
-        """)
+        """, params=[selected_store])
         if not inv_data.empty:
             st.dataframe(inv_data)
 
@@ -195,7 +361,8 @@ with tabs[4]:
             st.info(f"No inventory data for {selected_store}")
 
 # --- Promotions ---
-with tabs[5]:
+@st.fragment
+def promotions_tab():
     st.header("Promotions Overview")
 
     promo_data = run_query("""
@@ -210,39 +377,67 @@ with tabs[5]:
         st.dataframe(promo_data)
 
         # Bar chart discount rates per promo type
-        promo_type_df = promo_data.groupby("PROMO_TYPE")["DISCOUNT_RATE"].mean().reset_index()
+        promo_data["PROMO_TYPE"] = promo_data["PROMO_TYPE"].astype("category")
+        promo_type_df = promo_data.groupby("PROMO_TYPE", sort=False, observed=True)["DISCOUNT_RATE"].mean().reset_index()
         st.markdown("### Average Discount Rate by Promotion Type")
         st.bar_chart(promo_type_df.set_index("PROMO_TYPE")["DISCOUNT_RATE"])
     else:
         st.info("No promotion data available.")
 
 # --- Search ---
-with tabs[6]:
+@st.fragment
+def search_tab():
     st.header("Search Products & Orders")
 
-    search_term = st.text_input("Enter Product Name or Order ID")
+    search_term = st.text_input(
+        "Enter Product Name or Order ID", value=recall("search_term", ""),
+        key="search_term", on_change=remember, args=("search_term",),
+    )
+    match_modes = ["Starts with", "Contains"]
+    match_mode = st.radio(
+        "Product name", match_modes, index=match_modes.index(recall("match_mode", "Starts with")), horizontal=True,
+        key="match_mode", on_change=remember, args=("match_mode",),
+    )
 
     if search_term:
-        product_results = run_query(f"""
+        # Prefix patterns can prune on product_name; substring matches rely on
+        # ALTER TABLE DIM_PRODUCT ADD SEARCH OPTIMIZATION ON SUBSTRING(product_name)
+        pattern = f"{search_term}%" if match_mode == "Starts with" else f"%{search_term}%"
+        product_results = run_query_arrow("""
             SELECT dp.product_id, dp.product_name, dp.category
             FROM DIM_PRODUCT dp
-            WHERE LOWER(dp.product_name) LIKE '%{search_term.lower()}%'
+            WHERE dp.product_name ILIKE ?
             LIMIT 20
-        """)
+        """, params=[pattern])
         st.subheader("Matching Products")
-        if not product_results.empty:
+        if product_results.num_rows:
             st.dataframe(product_results)
         else:
             st.info("No matching products found.")
 
         if search_term.isdigit():
-            order_results = run_query(f"""
+            order_results = run_query_arrow("""
                 SELECT order_id, order_date_id, total_value
                 FROM FACT_ORDERS
-                WHERE order_id = {int(search_term)}
-            """)
+                WHERE order_id = ?
+            """, params=[int(search_term)])
             st.subheader("Order Details")
-            if not order_results.empty:
+            if order_results.num_rows:
                 st.dataframe(order_results)
             else:
                 st.info("No order found with that ID.")
+
+# st.tabs runs every tab body on each script run, so pick one section and render only that.
+# Widgets in hidden sections lose their state, which is why filters go through remember()/recall()
+TABS = {
+    "Overview": overview_tab,
+    "Store Performance": store_performance_tab,
+    "Product Sales": product_sales_tab,
+    "Customer Insights": customer_insights_tab,
+    "Inventory": inventory_tab,
+    "Promotions": promotions_tab,
+    "Search": search_tab,
+}
+
+active_tab = st.radio("Section", list(TABS), horizontal=True, label_visibility="collapsed", key="active_tab")
+TABS[active_tab]()